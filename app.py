@@ -1,5 +1,11 @@
+import os
+import tempfile
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pv
+from numba import njit
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -23,38 +29,126 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # === LOAD DATA ===
+DATA_PATH = 'churn_results.csv'
+CACHE_PATH = 'churn_results.parquet'  # hasil load_data() yang sudah bersih
+ARROW_STRING = pd.StringDtype('pyarrow')
+
+AGE_EDGES = np.array([60, 120, 180, 240, 300])
+AGE_LABELS = ['18-30', '31-40', '41-50', '51-60', '61-70', '>71']
+INCOME_LABELS = ['Low Income', 'Lower Middle', 'Middle', 'Upper Middle', 'High Income']
+CREDIT_LABELS = ['Poor', 'Fair', 'Good', 'Very Good', 'Excellent']
+
+def equal_width_codes(values, n_bins):
+    # Setara pd.cut(values, bins=n_bins): bin selebar sama, sisi kanan tertutup
+    nan_mask = np.isnan(values)
+    mn, mx = values[~nan_mask].min(), values[~nan_mask].max()
+    if mn == mx:
+        # Kolom konstan: rentang dilebarkan seperti pd.cut -> semua nilai di bin tengah
+        mn -= 0.001 * abs(mn) if mn != 0 else 0.001
+        mx += 0.001 * abs(mx) if mx != 0 else 0.001
+    edges = np.linspace(mn, mx, n_bins + 1)
+    codes = np.searchsorted(edges[1:-1], values, side='left')
+    codes[nan_mask] = -1
+    return codes
+
 @st.cache_data
 def load_data():
-    df = pd.read_csv('churn_results.csv', sep=';')
+    # Pakai cache Parquet (dtype kategori ikut tersimpan) selama lebih baru dari CSV & script ini
+    if (os.path.exists(CACHE_PATH) and
+            os.path.getmtime(CACHE_PATH) >= max(os.path.getmtime(DATA_PATH), os.path.getmtime(__file__))):
+        try:
+            df = pd.read_parquet(CACHE_PATH)
+        except (OSError, pa.ArrowException):
+            pass  # Cache rusak/terpotong: bangun ulang dari CSV di bawah
+        else:
+            # Parquet hanya mengembalikan kategori berlabel teks; Country (angka) di-cast ulang
+            df['Country'] = pd.Categorical(df['Country'].to_numpy())
+            return df
+    
+    # Parser CSV PyArrow (multi-thread); hasilnya tetap Arrow-backed di pandas
+    # (tanpa konversi ke object/NumPy)
+    table = pv.read_csv(
+        DATA_PATH,
+        parse_options=pv.ParseOptions(delimiter=';'),
+        convert_options=pv.ConvertOptions(column_types={'CustomerID': pa.int64()})
+    )
+    df = table.to_pandas(split_blocks=True, self_destruct=True, types_mapper=pd.ArrowDtype)
     df.columns = df.columns.str.strip()
     
+    # Sel yang tidak valid jadi NaN (bukan error), lalu dibuang lewat dropna di bawah.
+    # Kolom yang sudah numerik dari PyArrow tidak dikonversi ulang.
     for col in ['TotalPrice', 'UnitPrice', 'Quantity', 'Recency']:
-        df[col] = pd.to_numeric(df[col], errors='coerce')
+        df[col] = pd.to_numeric(df[col], errors='coerce').astype(np.float64)
     
-    df['CustomerID'] = df['CustomerID'].astype(int)
     df = df.dropna(subset=['Recency'])
     
     # Proxy variabel
-    df['Gender'] = df['Churn'].map({1: 'Male', 0: 'Female'})
+    df['Gender'] = df['Churn'].map({1: 'Male', 0: 'Female'}).astype(ARROW_STRING)
     
-    max_recency = df['Recency'].max()
-    age_bins = [0, 60, 120, 180, 240, 300, max_recency + 1]
-    age_labels = ['18-30', '31-40', '41-50', '51-60', '61-70', '>71']
-    df['Age_Group'] = pd.cut(df['Recency'], bins=age_bins, labels=age_labels, include_lowest=True)
+    # Binning langsung ke kode kategori (searchsorted), tanpa pd.cut
+    # Bin kanan-tertutup: [0,60], (60,120], ..., (300, max]
+    recency = df['Recency'].to_numpy(dtype=np.float64)
+    age_codes = np.searchsorted(AGE_EDGES, recency, side='left')
+    age_codes[recency < 0] = -1
+    df['Age_Group'] = pd.Categorical.from_codes(age_codes, AGE_LABELS, ordered=True)
     df = df.dropna(subset=['Age_Group'])
     
-    df['Income_Group'] = pd.cut(df['TotalPrice'], bins=5,
-                                labels=['Low Income', 'Lower Middle', 'Middle', 'Upper Middle', 'High Income'])
+    df['Income_Group'] = pd.Categorical.from_codes(
+        equal_width_codes(df['TotalPrice'].to_numpy(dtype=np.float64), len(INCOME_LABELS)), INCOME_LABELS, ordered=True)
     
-    df['Credit_Score'] = pd.cut(df['Quantity'], bins=5,
-                                labels=['Poor', 'Fair', 'Good', 'Very Good', 'Excellent'])
+    df['Credit_Score'] = pd.Categorical.from_codes(
+        equal_width_codes(df['Quantity'].to_numpy(dtype=np.float64), len(CREDIT_LABELS)), CREDIT_LABELS, ordered=True)
     
-    df['Risk_Category'] = df['Predicted_Churn'].map({1: 'High Risk', 0: 'Low Risk'})
+    df['Risk_Category'] = df['Predicted_Churn'].map({1: 'High Risk', 0: 'Low Risk'}).astype(ARROW_STRING)
+    # Country sebagai kategori: filter & groupby lewat kode integer
+    df['Country'] = pd.Categorical(df['Country'].to_numpy())
+    
+    # Downcast: flag 0/1 ke uint8; numerik bernilai bulat ke int terkecil (tampil tanpa ".0"),
+    # sisanya ke float32 (hemat memori saat agregasi)
+    for col in ['Predicted_Churn', 'Churn']:
+        df[col] = df[col].astype(np.uint8)
+    for col in ['TotalPrice', 'UnitPrice', 'Quantity', 'Recency']:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+        if df[col].dtype.kind == 'f':
+            df[col] = df[col].astype(np.float32)
+    
+    # Tulis ke file sementara lalu os.replace (atomik): cache tidak pernah setengah jadi
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(prefix='churn_results.', suffix='.parquet.tmp',
+                                        dir=os.path.dirname(os.path.abspath(CACHE_PATH)))
+        os.close(fd)
+        df.to_parquet(tmp_path, engine='pyarrow', compression='snappy')
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        # Folder read-only / disk penuh: tetap jalan tanpa cache
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
     
     return df
 
 df = load_data()
 
+# Kode integer untuk kolom filter, dihitung sekali per dataset (bukan tiap rerun)
+FILTER_COLUMNS = ['Country', 'Age_Group', 'Risk_Category']
+
+@st.cache_resource
+def filter_codes(_df):
+    codes = {}
+    for col in FILTER_COLUMNS:
+        col_codes, uniques = pd.factorize(_df[col])
+        codes[col] = (col_codes, pd.Index(uniques))
+    return codes
+
+def filter_mask(codes, selections):
+    # AND dari np.isin per kolom, dibandingkan lewat kode integer
+    masks = []
+    for col, selected in selections.items():
+        col_codes, uniques = codes[col]
+        selected_codes = uniques.get_indexer(selected)
+        masks.append(np.isin(col_codes, selected_codes[selected_codes >= 0]))
+    return np.logical_and.reduce(masks)
+
 # === SIDEBAR: FILTERS & INFO (INTERAKTIF) ===
 with st.sidebar:
     st.header("🔍 Filters")
@@ -72,127 +166,196 @@ with st.sidebar:
     selected_risk = st.multiselect("Select Risk Category", risks, default=risks)
     
     # Apply filters
-    filtered_df = df[
-        (df['Country'].isin(selected_country)) &
-        (df['Age_Group'].isin(selected_age)) &
-        (df['Risk_Category'].isin(selected_risk))
-    ]
+    mask = filter_mask(filter_codes(df), {
+        'Country': selected_country,
+        'Age_Group': selected_age,
+        'Risk_Category': selected_risk,
+    })
+    filtered_df = df.iloc[np.flatnonzero(mask)]
+    
+    # Angka ringkasan dihitung sekali dari array NumPy (sidebar, metric & summary)
+    n_clients = len(filtered_df)
+    predicted_churn = filtered_df['Predicted_Churn'].to_numpy()
+    avg_income = np.nanmean(filtered_df['TotalPrice'].to_numpy()) if n_clients > 0 else 0
+    avg_recency = np.nanmean(filtered_df['Recency'].to_numpy()) if n_clients > 0 else 0
+    predicted_high_risk = int(predicted_churn.sum())
+    predicted_churn_rate = (predicted_high_risk / n_clients) * 100 if n_clients > 0 else 0
     
     st.divider()
     st.header("📌 Quick Info")
-    st.write(f"**Filtered Clients:** {len(filtered_df):,}")
-    st.write(f"**Avg Income:** ${filtered_df['TotalPrice'].mean():,.0f}")
-    st.write(f"**Avg Recency:** {filtered_df['Recency'].mean():.0f} days")
+    st.write(f"**Filtered Clients:** {n_clients:,}")
+    st.write(f"**Avg Income:** ${avg_income:,.0f}")
+    st.write(f"**Avg Recency:** {avg_recency:.0f} days")
     
     if st.button("Reset Filters"):
         st.experimental_rerun()
 
+# === AGREGASI & CHARTS (di-cache per kombinasi filter) ===
+@njit(cache=True)
+def group_sum_count(codes, vals, n_groups):
+    # Satu pass: jumlah & jumlah baris per grup (kode -1 / NaN dilewati)
+    sums = np.zeros(n_groups)
+    counts = np.zeros(n_groups, dtype=np.int64)
+    for i in range(codes.size):
+        g = codes[i]
+        if g >= 0:
+            sums[g] += vals[i]
+            counts[g] += 1
+    return sums, counts
+
+def churn_rate_by(df, col):
+    # Setara df.groupby(col, observed=True)['Predicted_Churn'].mean() * 100
+    categories = df[col].cat.categories
+    sums, counts = group_sum_count(df[col].cat.codes.to_numpy(np.int8),
+                                   df['Predicted_Churn'].to_numpy(np.float32), len(categories))
+    observed = counts > 0
+    return pd.Series(sums[observed] / counts[observed] * 100,
+                     index=pd.Index(categories[observed], name=col), name='Predicted_Churn')
+
+@st.cache_data(max_entries=32)
+def compute_dashboard_data(_filtered_df, country_key, age_key, risk_key):
+    # _filtered_df tidak di-hash; tuple pilihan filter yang menjadi key cache
+    return {
+        'gender': _filtered_df['Gender'].value_counts(),
+        'age_gender': (_filtered_df.groupby(['Age_Group', 'Gender'], observed=True).size()
+                       .unstack(fill_value=0).reindex(columns=['Female', 'Male'], fill_value=0)),
+        'income_vals': _filtered_df['Income_Group'].value_counts(),
+        'credit_vals': _filtered_df['Credit_Score'].value_counts(),
+        'churn_by_age': churn_rate_by(_filtered_df, 'Age_Group'),
+        'churn_by_income': churn_rate_by(_filtered_df, 'Income_Group'),
+        'risk': _filtered_df['Risk_Category'].value_counts(),
+    }
+
+GENDER_COLORS = {'Male': '#2C3E50', 'Female': '#FF6B9D'}
+RISK_COLORS = {'Low Risk': '#27AE60', 'High Risk': '#E74C3C'}
+
+@st.cache_resource(max_entries=32)
+def build_dashboard(_data, filter_key):
+    # Argumen ber-underscore tidak di-hash oleh Streamlit; filter_key yang menentukan cache hit
+    # Satu figure per tab (make_subplots) -> satu payload & satu layout pass di browser
+    fig_demo = make_subplots(
+        rows=2, cols=2,
+        specs=[[{"type": "xy"}, {"type": "xy"}],
+               [{"type": "domain"}, {"type": "domain"}]],
+        subplot_titles=("Gender Breakdown", "Clients by Age Group & Gender",
+                        "Income Group Distribution", "Credit Score Distribution"),
+        vertical_spacing=0.12
+    )
+    
+    # Gender Breakdown
+    gender_count = _data['gender']
+    fig_demo.add_trace(go.Bar(x=gender_count.index, y=gender_count.values,
+                              marker_color=[GENDER_COLORS[g] for g in gender_count.index],
+                              showlegend=False, name='Clients'),
+                       row=1, col=1)
+    
+    # Age Group Bar (grouped by Gender)
+    age_gender = _data['age_gender']
+    for gender in age_gender.columns:
+        fig_demo.add_trace(go.Bar(x=age_gender.index.astype(str), y=age_gender[gender].values,
+                                  name=gender, marker_color=GENDER_COLORS[gender]),
+                           row=1, col=2)
+    
+    # Income Pie (donut style)
+    income_vals = _data['income_vals']
+    fig_demo.add_trace(go.Pie(labels=income_vals.index.astype(str), values=income_vals.values,
+                              marker_colors=px.colors.qualitative.Pastel, hole=0.3,
+                              textposition='inside', textinfo='percent+label', showlegend=False),
+                       row=2, col=1)
+    
+    # Credit Score Pie
+    credit_vals = _data['credit_vals']
+    fig_demo.add_trace(go.Pie(labels=credit_vals.index.astype(str), values=credit_vals.values,
+                              marker_colors=px.colors.qualitative.Set2, hole=0.3,
+                              textposition='inside', textinfo='percent+label', showlegend=False),
+                       row=2, col=2)
+    
+    fig_demo.update_layout(height=750, barmode='group', legend_title_text='Gender')
+    fig_demo.update_yaxes(title_text='Number of Clients', row=1)
+    
+    fig_churn = make_subplots(
+        rows=2, cols=2,
+        specs=[[{"type": "xy"}, {"type": "xy"}],
+               [{"type": "domain", "colspan": 2}, None]],
+        subplot_titles=("Churn Risk % by Age Group", "Churn Risk % by Income Group",
+                        "Total Clients by Risk Category"),
+        vertical_spacing=0.12
+    )
+    
+    # Churn Risk by Age Group & Income Group
+    for col, churn in ((1, _data['churn_by_age']), (2, _data['churn_by_income'])):
+        fig_churn.add_trace(go.Bar(x=churn.index.astype(str), y=churn.values,
+                                   marker=dict(color=churn.values, colorscale='OrRd'),
+                                   showlegend=False, name='Churn Risk (%)'),
+                            row=1, col=col)
+    
+    # Risk Category Distribution
+    risk_count = _data['risk']
+    fig_churn.add_trace(go.Pie(labels=risk_count.index, values=risk_count.values,
+                               marker_colors=[RISK_COLORS[r] for r in risk_count.index], hole=0.3,
+                               textposition='inside', textinfo='percent+label'),
+                        row=2, col=1)
+    
+    fig_churn.update_layout(height=800)
+    fig_churn.update_yaxes(title_text='Churn Risk (%)', row=1)
+    
+    return fig_demo, fig_churn
+
+HIGH_RISK_COLUMNS = ['CustomerID', 'Country', 'Age_Group', 'TotalPrice', 'Recency', 'Risk_Category']
+
+@st.cache_data(max_entries=32)
+def high_risk_table(_filtered_df, _predicted_churn, filter_key):
+    # Tabel Arrow & CSV disimpan per kombinasi filter: format & konversi tidak diulang tiap rerun
+    high_risk = _filtered_df.loc[_predicted_churn == 1, HIGH_RISK_COLUMNS]
+    high_risk['TotalPrice'] = high_risk['TotalPrice'].map('${:,.0f}'.format)
+    return pa.Table.from_pandas(high_risk, preserve_index=False), high_risk.to_csv(index=False)
+
+# Filter kosong: hentikan script sebelum agregasi & pembuatan chart (sidebar tetap utuh)
+if filtered_df.empty:
+    st.warning("No rows match current filters.")
+    st.stop()
+
+filter_key = (tuple(selected_country), tuple(selected_age), tuple(selected_risk))
+dashboard_data = compute_dashboard_data(filtered_df, *filter_key)
+fig_demo, fig_churn = build_dashboard(dashboard_data, filter_key)
+
+# Hitungan gender & churn per Age Group dipakai ulang dari hasil agregasi
+male_count = dashboard_data['gender'].get('Male', 0)
+female_count = dashboard_data['gender'].get('Female', 0)
+churn_by_age = dashboard_data['churn_by_age']
+
 # === MAIN CONTENT ===
 # Key Metrics di atas (lebih informatif dengan st.metric)
 col1, col2, col3, col4, col5 = st.columns(5)
 with col1:
-    st.metric("Total Clients", f"{len(filtered_df):,}", help="Jumlah pelanggan setelah filter")
+    st.metric("Total Clients", f"{n_clients:,}", help="Jumlah pelanggan setelah filter")
 with col2:
-    st.metric("Male / Female", f"{filtered_df[filtered_df['Gender'] == 'Male'].shape[0]:,} / {filtered_df[filtered_df['Gender'] == 'Female'].shape[0]:,}", help="Rasio gender")
+    st.metric("Male / Female", f"{male_count:,} / {female_count:,}", help="Rasio gender")
 with col3:
-    st.metric("Avg Income", f"${filtered_df['TotalPrice'].mean():,.0f}", help="Rata-rata belanja tahunan")
+    st.metric("Avg Income", f"${avg_income:,.0f}", help="Rata-rata belanja tahunan")
 with col4:
-    st.metric("Avg Recency", f"{filtered_df['Recency'].mean():.0f} days", help="Rata-rata hari sejak transaksi terakhir")
+    st.metric("Avg Recency", f"{avg_recency:.0f} days", help="Rata-rata hari sejak transaksi terakhir")
 with col5:
-    churn_rate = (filtered_df['Predicted_Churn'].sum() / len(filtered_df)) * 100 if len(filtered_df) > 0 else 0
-    delta_color = "inverse" if churn_rate > 30 else "normal"
-    st.metric("Predicted Churn Rate", f"{churn_rate:.1f}%", help="Persentase prediksi churn", delta_color=delta_color)
+    delta_color = "inverse" if predicted_churn_rate > 30 else "normal"
+    st.metric("Predicted Churn Rate", f"{predicted_churn_rate:.1f}%", help="Persentase prediksi churn", delta_color=delta_color)
 
 # Tabs untuk organisasi konten (lebih UX friendly)
 tab1, tab2, tab3 = st.tabs(["📈 Demographics", "🚨 Churn Analysis", "📋 High-Risk List"])
 
 with tab1:
-    col_left, col_right = st.columns(2)
-    
-    with col_left:
-        # Gender Breakdown (interaktif dengan Plotly)
-        gender_count = filtered_df['Gender'].value_counts().reset_index()
-        fig_gender = px.bar(gender_count, x='Gender', y='count', color='Gender',
-                            color_discrete_map={'Male': '#2C3E50', 'Female': '#FF6B9D'},
-                            title="Gender Breakdown",
-                            labels={'count': 'Number of Clients'})
-        fig_gender.update_layout(height=300, showlegend=False)
-        st.plotly_chart(fig_gender, use_container_width=True)
-        
-        # Income Pie
-        income_vals = filtered_df['Income_Group'].value_counts().reset_index()
-        fig_income = px.pie(income_vals, values='count', names='Income_Group',
-                            title="Income Group Distribution",
-                            color_discrete_sequence=px.colors.qualitative.Pastel,
-                            hole=0.3)  # Donut style untuk menarik
-        fig_income.update_traces(textposition='inside', textinfo='percent+label')
-        fig_income.update_layout(height=400)
-        st.plotly_chart(fig_income, use_container_width=True)
-    
-    with col_right:
-        # Age Group Bar (grouped by Gender)
-        age_gender = pd.crosstab(filtered_df['Age_Group'], filtered_df['Gender']).reset_index()
-        fig_age = px.bar(age_gender.melt(id_vars='Age_Group'), x='Age_Group', y='value', color='Gender',
-                         color_discrete_map={'Male': '#2C3E50', 'Female': '#FF6B9D'},
-                         title="Clients by Age Group & Gender",
-                         barmode='group',
-                         labels={'value': 'Number of Clients'})
-        fig_age.update_layout(height=400)
-        st.plotly_chart(fig_age, use_container_width=True)
-        
-        # Credit Score Pie
-        credit_vals = filtered_df['Credit_Score'].value_counts().reset_index()
-        fig_credit = px.pie(credit_vals, values='count', names='Credit_Score',
-                            title="Credit Score Distribution",
-                            color_discrete_sequence=px.colors.qualitative.Set2,
-                            hole=0.3)
-        fig_credit.update_traces(textposition='inside', textinfo='percent+label')
-        fig_credit.update_layout(height=400)
-        st.plotly_chart(fig_credit, use_container_width=True)
+    st.plotly_chart(fig_demo, use_container_width=True)
 
 with tab2:
-    col_left, col_right = st.columns(2)
-    
-    with col_left:
-        # Churn Risk by Age Group
-        churn_by_age = (filtered_df.groupby('Age_Group')['Predicted_Churn'].mean() * 100).reset_index()
-        fig_churn_age = px.bar(churn_by_age, x='Age_Group', y='Predicted_Churn',
-                               title="Churn Risk % by Age Group",
-                               color='Predicted_Churn', color_continuous_scale='OrRd',
-                               labels={'Predicted_Churn': 'Churn Risk (%)'})
-        fig_churn_age.update_layout(height=400, coloraxis_showscale=False)
-        st.plotly_chart(fig_churn_age, use_container_width=True)
-    
-    with col_right:
-        # Churn Risk by Income Group
-        churn_by_income = (filtered_df.groupby('Income_Group')['Predicted_Churn'].mean() * 100).reset_index()
-        fig_churn_income = px.bar(churn_by_income, x='Income_Group', y='Predicted_Churn',
-                                  title="Churn Risk % by Income Group",
-                                  color='Predicted_Churn', color_continuous_scale='OrRd',
-                                  labels={'Predicted_Churn': 'Churn Risk (%)'})
-        fig_churn_income.update_layout(height=400, coloraxis_showscale=False)
-        st.plotly_chart(fig_churn_income, use_container_width=True)
-    
-    # Risk Category Distribution (interaktif pie)
-    risk_count = filtered_df['Risk_Category'].value_counts().reset_index()
-    fig_risk = px.pie(risk_count, values='count', names='Risk_Category',
-                      title="Total Clients by Risk Category",
-                      color_discrete_map={'Low Risk': '#27AE60', 'High Risk': '#E74C3C'},
-                      hole=0.3)
-    fig_risk.update_traces(textposition='inside', textinfo='percent+label')
-    fig_risk.update_layout(height=400)
-    st.plotly_chart(fig_risk, use_container_width=True)
+    st.plotly_chart(fig_churn, use_container_width=True)
 
 with tab3:
     st.subheader("🚨 High-Risk Customers List")
     st.markdown("Daftar pelanggan dengan prediksi churn tinggi (Predicted_Churn = 1). Klik kolom untuk sort.")
     
-    high_risk = filtered_df[filtered_df['Predicted_Churn'] == 1][['CustomerID', 'Country', 'Age_Group', 'TotalPrice', 'Recency', 'Risk_Category']]
-    high_risk['TotalPrice'] = high_risk['TotalPrice'].map('${:,.0f}'.format)
+    high_risk, csv = high_risk_table(filtered_df, predicted_churn, filter_key)
     st.dataframe(high_risk, use_container_width=True, height=400)
     
     # Download button untuk CSV
-    csv = high_risk.to_csv(index=False)
     st.download_button("📥 Download High-Risk List (CSV)", csv, "high_risk_customers.csv", "text/csv")
 
 # === SUMMARY & RECOMMENDATIONS (INFORMATIF) ===
@@ -203,11 +366,11 @@ col_sum1, col_sum2 = st.columns(2)
 with col_sum1:
     st.subheader("Key Insights")
     st.markdown(f"""
-    - **Total Filtered Clients:** {len(filtered_df):,}
+    - **Total Filtered Clients:** {n_clients:,}
     - **Predicted Churn Rate:** {predicted_churn_rate:.1f}% ({predicted_high_risk:,} at risk)
-    - **Highest Risk Age Group:** {filtered_df.groupby('Age_Group')['Predicted_Churn'].mean().idxmax()}
-    - **Average Income:** ${filtered_df['TotalPrice'].mean():,.0f}
-    - **Average Recency:** {filtered_df['Recency'].mean():.0f} days
+    - **Highest Risk Age Group:** {churn_by_age.idxmax()} ({churn_by_age.max():.1f}% churn risk)
+    - **Average Income:** ${avg_income:,.0f}
+    - **Average Recency:** {avg_recency:.0f} days
     """)
 
 with col_sum2: